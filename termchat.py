@@ -3,10 +3,16 @@
 # Termchat - Cross-platform Python terminal client for real-time chat
 # Connects to termchat-backend via HTTPS WebSocket on port 443
 
+import argparse
 import asyncio
 import websockets
+from websockets.protocol import State
 import json
+import functools
+import itertools
 import sys
+import time
+from collections import OrderedDict
 import certifi
 import ssl
 from typing import Optional
@@ -16,12 +22,31 @@ from textual.widgets import Input, RichLog, Static, Label
 from textual.binding import Binding
 from textual.screen import Screen
 from rich.markup import escape
+from rich.style import Style
+from rich.text import Text
 import os
 import platform
 import subprocess
 import shlex
 import aiohttp
 
+# Prefer orjson for the per-message encode/decode, falling back to the stdlib.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        # Frames go out as text, so decode orjson's bytes once here
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# Shared certifi-backed SSL context, built once so the CA bundle is only parsed at startup
+SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
 
 def is_in_terminal():
     # Heuristically check if we're running in a real terminal.
@@ -30,13 +55,17 @@ def is_in_terminal():
 def launch_new_terminal():
     # Attempt to launch a new terminal window running this script.
     script_path = os.path.abspath(__file__)
+    # Pass our command line options (e.g. --server-url) on to the relaunched client
+    script_args = shlex.join(sys.argv[1:])
 
     if platform.system() == "Windows":
         python = shlex.quote(sys.executable)
+        # Double-quoted so cmd doesn't act on characters like & in a server URL
+        script_args = " ".join(f'"{arg}"' for arg in sys.argv[1:])
         if script_path.lower().endswith(".py"):
-            cmd = f'start cmd /k {python} "{script_path}"'
+            cmd = f'start cmd /k {python} "{script_path}" {script_args}'
         else:
-            cmd = f'start cmd /k "{script_path}"'
+            cmd = f'start cmd /k "{script_path}" {script_args}'
         os.system(cmd)
         sys.exit(0)
 
@@ -45,6 +74,8 @@ def launch_new_terminal():
         # Set bounds for the window (pixels)
         left, top = 100, 100
         right, bottom = left + 912, top + 520
+        # The command is embedded in an AppleScript string literal
+        script_args = script_args.replace("\\", "\\\\").replace('"', '\\"')
     
         # Launch the script in Terminal, reusing the same window if one already exists.
         # If no Terminal windows exist, this creates one and sets bounds.
@@ -53,14 +84,14 @@ def launch_new_terminal():
             activate
             if (count of windows) = 0 then
                 -- no windows: create a new window and run the command
-                set theResult to do script "{python} {script_path}"
+                set theResult to do script "{python} {script_path} {script_args}"
                 delay 0.12
                 try
                     set bounds of front window to {{{left}, {top}, {right}, {bottom}}}
                 end try
             else
                 -- there is an existing window: run in the front window (creates a new tab in that window)
-                do script "{python} {script_path}" in front window
+                do script "{python} {script_path} {script_args}" in front window
             end if
         end tell
         '''
@@ -71,10 +102,10 @@ def launch_new_terminal():
     elif platform.system() == "Linux":
         python = shlex.quote(sys.executable)
         terminals = [
-            f'gnome-terminal -- {python} "{script_path}"',
-            f'konsole -e {python} "{script_path}"',
-            f'xfce4-terminal -e "{python} {script_path}"',
-            f'xterm -e {python} "{script_path}"'
+            f'gnome-terminal -- {python} "{script_path}" {script_args}',
+            f'konsole -e {python} "{script_path}" {script_args}',
+            f'xfce4-terminal -e {shlex.quote(f"{python} {shlex.quote(script_path)} {script_args}")}',
+            f'xterm -e {python} "{script_path}" {script_args}'
         ]
         for term in terminals:
             try:
@@ -88,28 +119,114 @@ def launch_new_terminal():
         print("Unsupported OS.")
         sys.exit(1)
         
+async def open_websocket(server_url: str):
+    # Open a WebSocket to the backend with the options used for chat sessions
+    return await websockets.connect(
+        server_url,
+        ssl=SSL_CONTEXT if server_url.startswith("wss://") else None,  # Plain ws:// for a local backend
+        ping_interval=30,
+        ping_timeout=10,
+        close_timeout=5,
+        max_size=2**20,  # 1MB max message size
+        max_queue=256,   # Max queued messages, enough to absorb bursts
+        write_limit=2**16,  # Buffer this much outgoing data before send() waits for a drain
+        compression=None # Chat frames are too small for deflate to pay off
+    )
+
 async def get_general_count(server_url: str) -> int:
-    # Converts wss://... to https://... and gets /general-count using certifi-backed SSL.
-    http_host = server_url.replace("wss://", "https://").split("/")[2]
-    endpoint = f"https://{http_host}/general-count"
-    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    # Converts wss://... to https://... (or ws://... to http://...) and gets /general-count
+    # using certifi-backed SSL.
+    scheme = "https" if server_url.startswith("wss://") else "http"
+    http_host = server_url.split("/")[2]
+    endpoint = f"{scheme}://{http_host}/general-count"
     try:
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        connector = aiohttp.TCPConnector(ssl=SSL_CONTEXT)
         async with aiohttp.ClientSession(connector=connector) as session:
             async with session.get(endpoint, timeout=3) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=json_loads)
                     return data.get("userCount", 0)
     except Exception:
         pass
     return 0
 
+# Default theme color (#87CEEB) as RGB, used when a color can't be parsed
+THEME_RGB = (135, 206, 235)
+
+@functools.lru_cache(maxsize=256)
+def hex_to_rgb(hex_color: str, fallback: tuple = (0, 0, 0)) -> tuple:
+    # Parse "#rrggbb" into an (r, g, b) tuple. Animations only ever see a handful
+    # of distinct colors, so the parsed result is cached.
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 6:
+        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    return fallback
+
+def rgb_to_hex(r, g, b) -> str:
+    return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
+
+@functools.lru_cache(maxsize=32)
+def color_ramp(start_rgb: tuple, end_rgb: tuple, steps: int, shade: float) -> tuple:
+    # Precompute the (color, shaded color) hex pairs for a linear transition so
+    # animation frames only index into the table. Cached for repeated shifts.
+    ramp = []
+    for i in range(steps + 1):
+        t = i / steps
+        r = start_rgb[0] + (end_rgb[0] - start_rgb[0]) * t
+        g = start_rgb[1] + (end_rgb[1] - start_rgb[1]) * t
+        b = start_rgb[2] + (end_rgb[2] - start_rgb[2]) * t
+        ramp.append((rgb_to_hex(r, g, b), rgb_to_hex(r * shade, g * shade, b * shade)))
+    return tuple(ramp)
+
 # User colors for cycling through usernames
-USER_COLORS = [
+USER_COLORS = (
     "red", "green", "yellow", "magenta", 
     "cyan", "bright_red", "bright_yellow", 
     "bright_magenta", "bright_cyan"
-]
+)
+
+# Color used for messages from the server
+SERVER_COLOR = "bold #87CEEB"
+
+# Parsed once so chat log lines can be built as Text without any markup parsing
+SERVER_STYLE = Style.parse(SERVER_COLOR)
+
+# Style for the notice shown when the server kicks us
+KICKED_STYLE = Style.parse("bold #FF0000")
+
+# Username reserved for messages from the server
+RESERVED_USERNAME = "server"
+
+def is_reserved_username(username: str) -> bool:
+    # Case-insensitive match against the reserved name; the length check
+    # skips allocating a casefolded copy for almost every username
+    return len(username) == len(RESERVED_USERNAME) and username.casefold() == RESERVED_USERNAME
+
+# Client-side chat commands
+CLEAR_COMMANDS = frozenset(("/clear", "/c"))
+QUIT_COMMANDS = frozenset(("/quit", "/exit", "/q"))
+
+# Backend server URL (HTTPS WebSocket on port 443), overridable with --server-url
+DEFAULT_SERVER_URL = "wss://termchat-f9cgabe4ajd9djb9.australiaeast-01.azurewebsites.net"
+
+# Distinct users whose color and name prefix are remembered; the least recently seen are forgotten
+MAX_TRACKED_USERS = 1024
+
+# Lines of chat history kept in the message log; older lines are dropped
+MAX_SCROLLBACK_LINES = 1000
+
+# Incoming lines are collected and written to the log once per frame (~60 fps),
+# or straight away once this many are waiting
+LOG_FLUSH_INTERVAL = 1 / 60
+MAX_PENDING_LINES = 64
+
+# Reconnect attempts after the connection drops, doubling the delay from 0.5s
+# (0.5, 1, 2 ... 16s) until it's capped at the max delay for the last two
+RECONNECT_ATTEMPTS = 8
+RECONNECT_MAX_DELAY = 30
+
+# Outgoing messages allowed to wait for the socket before new ones are refused
+MAX_OUTBOX_MESSAGES = 256
 
 # ASCII Art for TERMCHAT
 TERMCHAT_ASCII = """
@@ -120,6 +237,10 @@ TERMCHAT_ASCII = """
    ██    ███████ ██   ██ ██      ██  ██████ ██   ██ ██   ██    ██    
 """
 
+# The banner as ready-made Text: no markup to parse and no wrapping to measure.
+# It carries no style of its own, since the splash animates the widget's color.
+SPLASH_TEXT = Text(TERMCHAT_ASCII, no_wrap=True)
+
 class SplashScreen(Screen):
     # ASCII Art splash screen shown with a slide-up + fade-in animation
     
@@ -141,7 +262,7 @@ class SplashScreen(Screen):
 
     def compose(self) -> ComposeResult:
         # Create the Static so we can animate it in on_mount.
-        yield Static(TERMCHAT_ASCII, id="splash")
+        yield Static(SPLASH_TEXT, id="splash")
 
     def on_mount(self):
         # Start the splash animation asynchronously and advance when done.
@@ -164,6 +285,15 @@ class SplashScreen(Screen):
         total_frames = int(duration * target_fps)
         start_offset_y = 25  # start a few rows lower (slides up to 0)
         
+        # Precompute every frame's slide offset, opacity and color (black to cyan)
+        # so the paced loop below only has to apply styles
+        frames = []
+        for i in range(total_frames + 1):
+            eased = ease_out_expo(i / total_frames)
+            y = int(start_offset_y * (1 - eased))
+            color = rgb_to_hex(*(c * eased for c in THEME_RGB))
+            frames.append((y, float(eased), color))
+        
         try:
             splash = self.query_one("#splash", Static)
             
@@ -176,27 +306,18 @@ class SplashScreen(Screen):
             await asyncio.sleep(0.016)
             
             # 60fps animation loop - slide up AND color fade
-            for i in range(total_frames + 1):
-                t = i / total_frames
-                eased = ease_out_expo(t)
-                
-                # Slide animation
-                y = int(start_offset_y * (1 - eased))
-                opacity = float(eased)
-                
-                # Color fade animation (black to cyan)
-                r = int(135 * eased)  # #87CEEB = 135, 206, 235
-                g = int(206 * eased)
-                b = int(235 * eased)
-                color = f"#{r:02x}{g:02x}{b:02x}"
-                
+            # Frames are paced against a monotonic deadline so slow frames don't drift the animation
+            next_frame = time.monotonic()
+            for y, opacity, color in frames:
                 # Apply all animations
                 splash.styles.offset = (0, y)
                 splash.styles.opacity = opacity
                 splash.styles.color = color
                 
                 splash.refresh()
-                await asyncio.sleep(frame_time)
+                next_frame += frame_time
+                delay = next_frame - time.monotonic()
+                await asyncio.sleep(delay if delay > 0 else 0)
 
             # Ensure final exact values
             splash.styles.offset = (0, 0)
@@ -335,7 +456,12 @@ class ConnectionScreen(Screen):
         yield Label("", id="general_count_label")
 
     def on_mount(self):
-        self.query_one("#username_input").focus()
+        # Cache the form widgets used by the connect handlers
+        self._username_input = self.query_one("#username_input", Input)
+        self._chatname_input = self.query_one("#chatname_input", Input)
+        self._password_input = self.query_one("#password_input", Input)
+        self._status_label = self.query_one("#status_label", Label)
+        self._username_input.focus()
         self.set_timer(0.1, self.check_server_status)
         asyncio.create_task(self.update_general_count())
 
@@ -348,12 +474,14 @@ class ConnectionScreen(Screen):
     async def check_server_status(self):
     # Foolproof: check server reachability using a certifi-backed SSL context
         try:
-            import websockets  # keep local import if desired
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            # short timeout/ping to keep this check fast
-            ws = await websockets.connect(self.app.server_url, ssl=ssl_context, ping_timeout=2)
-            await ws.close()
+            websocket = await open_websocket(self.app.server_url)
             self.server_available = True
+            # Keep the probe connection open so the chat can reuse it instead of
+            # paying for a second TLS handshake, unless a chat already started without it
+            if self.app.screen is self:
+                self.app.spare_websocket = websocket
+            else:
+                await websocket.close()
         except Exception:
             self.server_available = False
         self.update_indicator()
@@ -375,9 +503,9 @@ class ConnectionScreen(Screen):
     async def on_input_submitted(self, event: Input.Submitted):
         # Handle Enter key in any input field - navigate to next or connect
         if event.input.id == "username_input":
-            self.query_one("#chatname_input").focus()
+            self._chatname_input.focus()
         elif event.input.id == "chatname_input":
-            self.query_one("#password_input").focus()
+            self._password_input.focus()
         elif event.input.id == "password_input":
             await self.action_connect()
 
@@ -385,14 +513,14 @@ class ConnectionScreen(Screen):
         if self.connecting:
             return  # Already connecting
             
-        username = self.query_one("#username_input").value.strip()
-        chat_name = self.query_one("#chatname_input").value.strip()
-        password = self.query_one("#password_input").value.strip()
+        username = self._username_input.value.strip()
+        chat_name = self._chatname_input.value.strip()
+        password = self._password_input.value.strip()
         
         # Only check for forbidden username, no empty field warnings
-        if username.lower() == "server":
+        if is_reserved_username(username):
             self.app.notify("Username 'server' is forbidden!", severity="error")
-            self.query_one("#username_input").focus()
+            self._username_input.focus()
             return
         
         # Use defaults if fields are empty
@@ -409,12 +537,12 @@ class ConnectionScreen(Screen):
         except Exception as e:
             # Connection failed, show error and reset
             self.connecting = False
-            status_label.update(f"[red]Connection failed: {str(e)}[/red]")
+            self._status_label.update(f"[red]Connection failed: {str(e)}[/red]")
             self.app.notify(f"Could not connect to server: {str(e)}", severity="error")
 
 
-    def action_quit(self):
-        self.app.exit()
+    async def action_quit(self):
+        await self.app.action_quit()
 
 
 class ChatScreen(Screen):
@@ -485,23 +613,69 @@ class ChatScreen(Screen):
         self.username = username
         self.chat_name = chat_name
         self.password = password
+        # The join frame only depends on the credentials, so encode it once
+        self._auth_frame = json_dumps({
+            "type": "join",
+            "username": username,
+            "chatname": chat_name,
+            "password": password
+        })
+        # Server message type -> handler, looked up once per incoming frame
+        self._handlers = {
+            "message": self._handle_chat,
+            "join": self._handle_join,
+            "leave": self._handle_leave,
+            "colourshift": self._handle_colourshift,
+            "bgshift": self._handle_bgshift,
+            "chatclear": self._handle_chatclear,
+            "kicked": self._handle_kicked,
+            "error": self._handle_error,
+            "auth_failed": self._handle_auth_failed,
+        }
+        # Text lines waiting to be written to the message log by _flush_log
+        self._pending_lines = []
+        self._flush_handle = None
+        # Outgoing frames, drained by _writer_loop so a stalled socket can't back up input handling
+        self._outbox = asyncio.Queue(maxsize=MAX_OUTBOX_MESSAGES)
+        # Background tasks, kept so they can be cancelled when the screen goes away
+        self._listen_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
 
         
     def compose(self) -> ComposeResult:
         yield Label(f"TERMCHAT - Connecting to '{self.chat_name}'...", id="header")
         with Container(id="messages_container"):
-            yield RichLog(id="messages", highlight=True, markup=True)
+            # Lines carry their own markup, so skip rich's per-line regex highlighter
+            yield RichLog(id="messages", highlight=False, markup=True, max_lines=MAX_SCROLLBACK_LINES)
         with Container(id="input_container"):
             yield Input(placeholder="Type your message here...", id="message_input")
 
     async def on_mount(self):
         # Initialize the chat screen
+        # The loop is reused for the background tasks and the log flush timer
+        self._loop = asyncio.get_running_loop()
+        # Cache widgets that are used on every incoming message
+        self._messages_log = self.query_one("#messages", RichLog)
+        self._header = self.query_one("#header")
+        # ...and the ones restyled on every frame of the color transitions
+        self._messages_container = self.query_one("#messages_container")
+        self._input_container = self.query_one("#input_container")
+        self._message_input = self.query_one("#message_input")
         # Start connection to server
         await self.connect_to_server()
-        input_widget = self.query_one("#message_input")
+        input_widget = self._message_input
         input_widget.can_focus = True
         input_widget.focus()
 
+    def on_unmount(self):
+        # Stop the background tasks and pending log flush when leaving the chat
+        for task in (self._listen_task, self._writer_task):
+            if task is not None:
+                task.cancel()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
     async def on_input_submitted(self, event: Input.Submitted):
         # Handle user message input
         if event.input.id != "message_input":
@@ -513,94 +687,40 @@ class ChatScreen(Screen):
         if not user_message:
             return
         
-        # Handle clear command
-        if user_message.lower() in ['/clear','/c']:
-            messages_log = self.query_one("#messages", RichLog)
-            messages_log.clear()
-            return
+        # Commands start with '/', so plain messages skip the lowercasing and lookups
+        if user_message.startswith('/'):
+            command = user_message.lower()
             
-        # Handle quit commands
-        if user_message.lower() in ['/quit', '/exit', '/q']:
-            await self.app.action_quit()
-            return
+            # Handle clear command
+            if command in CLEAR_COMMANDS:
+                self._clear_log()
+                return
+                
+            # Handle quit commands
+            if command in QUIT_COMMANDS:
+                await self.app.action_quit()
+                return
         
         # Send message to server
         await self.send_message(user_message)
 
-    def action_quit(self):
-        self.app.action_quit()
+    async def action_quit(self):
+        await self.app.action_quit()
 
 
     async def connect_to_server(self):
         # Establish WebSocket connection to the backend
-        messages_log = self.query_one("#messages", RichLog)
-        
         try:
-            # Create SSL context with proper settings
-            import ssl
-            import certifi
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            
-            self.app.websocket = await websockets.connect(
-                self.app.server_url,
-                ssl=ssl_context,
-                ping_interval=30,
-                ping_timeout=10,
-                close_timeout=10,
-                max_size=2**20,  # 1MB max message size
-                max_queue=32     # Max queued messages
-            )
-            
-            # Send authentication message
-            auth_message = {
-                "type": "join",
-                "username": self.username,
-                "chatname": self.chat_name,
-                "password": self.password
-            }
-            
-            await self.app.websocket.send(json.dumps(auth_message))
-            
-            # Wait for join confirmation before considering connection complete
-            try:
-                while True:
-                    response = await asyncio.wait_for(self.app.websocket.recv(), timeout=10.0)
-                    data = json.loads(response)
-                    
-                    if data.get("type") == "join" and data.get("username") == self.username:
-                        # Join successful - set connected state
-                        self.app.connected = True
-                        self.query_one("#header").update(f"TERMCHAT - Connected to server:'{self.chat_name}'")
-                        messages_log.write(f"[bold #87CEEB]Successfully joined chat '{self.chat_name}'[/bold #87CEEB]")
-                        # Focus the input field after successful connection
-                        self.query_one("#message_input").focus()
-                        break
-                    elif data.get("type") == "message":
-                        # Handle server messages during connection
-                        username = data.get("username", "Unknown")
-                        message = data.get("content", "")
-                        
-                        if username == "Server":
-                            messages_log.write(f"[bold #87CEEB]Server:[/bold #87CEEB] {escape(message)}")
-                        else:
-                            user_color = self.app.get_user_color(username)
-                            messages_log.write(f"[{user_color}]\\[{escape(username)}]:[/{user_color}] {escape(message)}")
-                    elif data.get("type") == "error":
-                        error_message = data.get("message", "Connection failed")
-                        raise Exception(error_message)
-                        
-            except asyncio.TimeoutError:
-                raise Exception("Server response timeout - no join confirmation received")
-            
-            # Start listening for messages after successful join
-            asyncio.create_task(self.listen_for_messages())
+            await self._join_chat()
+            # The writer outlives reconnects, so it's only started once
+            self._writer_task = self._loop.create_task(self._writer_loop(), name="ws-writer")
             
         except websockets.exceptions.InvalidStatusCode as e:
             if e.status_code == 403:
                 error_msg = "Server is currently disabled or unavailable"
             else:
                 error_msg = f"Server rejected connection: HTTP {e.status_code}"
-            messages_log.write(f"[bold red]{error_msg}[/bold red]")
+            self._write_line(f"[bold red]{error_msg}[/bold red]")
             self.app.notify(error_msg, severity="error")
             self.app.pop_screen()
         except OSError as e:
@@ -610,7 +730,7 @@ class ChatScreen(Screen):
                 error_msg = "Server is not responding"
             else:
                 error_msg = f"Network error: {str(e)}"
-            messages_log.write(f"[bold red]{error_msg}[/bold red]")
+            self._write_line(f"[bold red]{error_msg}[/bold red]")
             self.app.notify(error_msg, severity="error")
             self.app.pop_screen()
         except Exception as e:
@@ -618,124 +738,265 @@ class ChatScreen(Screen):
                 error_msg = "Server is currently disabled or unavailable"
             else:
                 error_msg = f"Failed to connect to server: {e}"
-            messages_log.write(f"[bold red]{error_msg}[/bold red]")
+            self._write_line(f"[bold red]{error_msg}[/bold red]")
             self.app.notify(error_msg, severity="error")
             self.app.pop_screen()
 
+    async def _join_chat(self):
+        # Open the WebSocket, authenticate and wait for the server to confirm the join.
+        # Raises on failure; the callers decide whether to give up or retry.
+        # Try the status probe's connection first if it's still open. It can look open
+        # but be dead (e.g. after sleep or a network change), so a quick ping checks it
+        # before the credentials go out on it.
+        websocket = self.app.take_spare_websocket()
+        if websocket is not None:
+            try:
+                await asyncio.wait_for(await websocket.ping(), 1)
+            except (websockets.exceptions.ConnectionClosed, OSError, asyncio.TimeoutError):
+                # Closing a dead socket waits out close_timeout, so don't hold up the join
+                self._loop.create_task(websocket.close())
+                websocket = None
+        if websocket is not None:
+            try:
+                await self._authenticate(websocket)
+            except (websockets.exceptions.ConnectionClosed, OSError):
+                # It died before the server replied, so join again on a fresh connection.
+                # Replies like a login error are raised to the caller as they are.
+                websocket = None
+        if websocket is None:
+            await self._authenticate(await open_websocket(self.app.server_url))
+        
+        # Start listening for messages after successful join
+        self._listen_task = self._loop.create_task(self.listen_for_messages(), name="ws-listen")
+
+    async def _authenticate(self, websocket):
+        # Send authentication message on websocket and wait for join confirmation
+        self.app.websocket = websocket
+        try:
+            await websocket.send(self._auth_frame)
+            await self._wait_for_join(websocket)
+        except Exception:
+            # Don't leave a failed join's connection open for the server to accept later
+            await websocket.close()
+            raise
+
+    async def _wait_for_join(self, websocket):
+        # Wait for the server to confirm our join, showing any messages sent before it
+        replied = False
+        try:
+            while True:
+                response = await asyncio.wait_for(websocket.recv(), timeout=10.0)
+                replied = True
+                data = json_loads(response)
+                
+                if data.get("type") == "join" and data.get("username") == self.username:
+                    # Join successful - set connected state
+                    self.app.connected = True
+                    self._header.update(f"TERMCHAT - Connected to server:'{self.chat_name}'")
+                    self._write_line(Text(f"Successfully joined chat '{self.chat_name}'", style=SERVER_STYLE))
+                    # Focus the input field after successful connection
+                    self._message_input.focus()
+                    break
+                elif data.get("type") == "message":
+                    # Handle server messages during connection
+                    self._handle_chat(data)
+                elif data.get("type") == "error":
+                    error_message = data.get("message", "Connection failed")
+                    raise Exception(error_message)
+                    
+        except asyncio.TimeoutError:
+            raise Exception("Server response timeout - no join confirmation received")
+        except websockets.exceptions.ConnectionClosed as e:
+            # Only a close before any reply means the connection itself was unusable
+            if not replied:
+                raise
+            raise Exception("Connection closed before the join was confirmed") from e
+
     async def listen_for_messages(self):
         # Listen for incoming messages from the server
-        messages_log = self.query_one("#messages", RichLog)
+        # Await recv() directly rather than going through the async-iterator protocol
+        recv = self.app.websocket.recv
         
         try:
-            async for message in self.app.websocket:
+            while True:
+                try:
+                    message = await recv()
+                except websockets.exceptions.ConnectionClosedOK:
+                    # Our own close on quit ends the loop quietly. A clean close from the
+                    # server (e.g. going away for a restart) is a drop like any other.
+                    if not self.app.connected:
+                        break
+                    raise
                 try:
-                    data = json.loads(message)
+                    data = json_loads(message)
                     await self.handle_message(data)
                 except json.JSONDecodeError:
-                    messages_log.write(f"[bold red]Received invalid JSON: {escape(message[:100])}...[/bold red]")
+                    self._write_line(f"[bold red]Received invalid JSON: {escape(message[:100])}...[/bold red]")
                 except Exception as e:
-                    messages_log.write(f"[bold red]Error processing message: {e}[/bold red]")
+                    self._write_line(f"[bold red]Error processing message: {e}[/bold red]")
         except websockets.exceptions.ConnectionClosed:
-            messages_log.write("[bold yellow]Connection to server lost.[/bold yellow]")
+            was_connected = self.app.connected
+            self._write_line("[bold yellow]Connection to server lost.[/bold yellow]")
             self.app.connected = False
-            self.query_one("#header").update("TERMCHAT - Disconnected")
+            self._header.update("TERMCHAT - Disconnected")
             self.app.notify("Connection lost", severity="warning")
+            # Quitting clears connected before closing, so only unexpected drops reconnect
+            if was_connected:
+                await self._reconnect()
         except websockets.exceptions.ConnectionClosedError as e:
-            messages_log.write(f"[bold yellow]Connection closed: {e}[/bold yellow]")
+            self._write_line(f"[bold yellow]Connection closed: {e}[/bold yellow]")
             self.app.connected = False
-            self.query_one("#header").update("TERMCHAT - Connection Closed")
+            self._header.update("TERMCHAT - Connection Closed")
         except Exception as e:
-            messages_log.write(f"[bold red]Error receiving messages: {e}[/bold red]")
+            self._write_line(f"[bold red]Error receiving messages: {e}[/bold red]")
             self.app.connected = False
 
+    async def _reconnect(self):
+        # Rejoin the chat after a dropped connection, backing off between attempts
+        for attempt in range(RECONNECT_ATTEMPTS):
+            delay = min(RECONNECT_MAX_DELAY, 0.5 * 2 ** attempt)
+            self._header.update(f"TERMCHAT - Reconnecting in {delay:g}s...")
+            await asyncio.sleep(delay)
+            try:
+                await self._join_chat()
+                return
+            except Exception as e:
+                self._write_line(f"[bold yellow]Reconnect failed: {escape(str(e))}[/bold yellow]")
+        self._header.update("TERMCHAT - Disconnected")
+        self._write_line("[bold red]Could not reconnect to server.[/bold red]")
+
     async def handle_message(self, data):
-        # Handle different types of messages from the server
-        messages_log = self.query_one("#messages", RichLog)
-        message_type = data.get("type", "")
-        
-        if message_type == "message":
+        # Dispatch a message from the server to its handler by type.
+        # Only the animated/delayed handlers are coroutines; the rest run
+        # synchronously so plain chat lines don't allocate a coroutine.
+        handler = self._handlers.get(data.get("type", ""))
+        if handler is not None:
+            result = handler(data)
+            if result is not None:
+                await result
+
+    def _handle_chat(self, data):
+        # Chat frames always carry both fields; only fall back to defaults for a malformed one
+        try:
+            username = data["username"]
+            message = data["content"]
+        except KeyError:
             username = data.get("username", "Unknown")
             message = data.get("content", "")
-            
-            # Display messages with proper formatting - show ALL messages including own
-            if username == "Server":
-                messages_log.write(f"[bold #87CEEB]Server:[/bold #87CEEB] {escape(message)}")
-            else:
-                user_color = self.app.get_user_color(username)
-                messages_log.write(f"[{user_color}]\\[{escape(username)}]:[/{user_color}] {escape(message)}")
-        
-        elif message_type == "join":
-            username = data.get("username", "Unknown")
-            # Handle other users joining - server doesn't send join notifications back to joining user
-            if username and username != self.username:
-                messages_log.write(f"[bold #87CEEB]A wild {escape(username)} has appeared.[/bold #87CEEB]")
-        
-        elif message_type == "leave":
-            username = data.get("username", "Unknown") 
-            # Show leave notifications for all users
-            if username and username != self.username:
-                messages_log.write(f"[bold #87CEEB]{escape(username)} has left the chat.[/bold #87CEEB]")
-        
-        elif message_type == "colourshift":
-            # Handle theme color change
-            new_color = data.get("color", "#87CEEB")
-            await self.change_theme_color(new_color)
-            # messages_log.write(f"[bold {new_color}]Theme color changed to {new_color}[/bold {new_color}]")
-        
-        elif message_type == "bgshift":
-            messages_log = self.query_one("#messages", RichLog)
-            messages_log.clear()
-            bg_color = data.get("color", "#000000")
-            await self.change_background_color(bg_color)
-
-        elif message_type == "chatclear":
-            messages_log = self.query_one("#messages", RichLog)
-            messages_log.clear()
-
-        elif message_type == "kicked":
-            kicked_message = data.get("message", "You have been kicked :)")
-            messages_log = self.query_one("#messages", RichLog)
-            messages_log.clear()
-            messages_log.write(f"[bold #FF0000]{kicked_message}[/bold #FF0000]")
-            await asyncio.sleep(5)
-            await self.app.action_quit()
-            return
         
-        elif message_type == "error":
-            error_message = data.get("message", "Unknown error")
-            messages_log.write(f"[bold red]Error: {escape(error_message)}[/bold red]")
-            # If connection failed, go back to connection screen
-            if not self.app.connected:
-                self.app.notify(f"Connection failed: {error_message}", severity="error")
-                self.app.pop_screen()  # Return to connection screen
-        
-        elif message_type == "auth_failed":
-            error_message = data.get("message", "Authentication failed")
-            messages_log.write(f"[bold red]Authentication failed: {escape(error_message)}[/bold red]")
-            self.app.notify(f"Authentication failed: {error_message}", severity="error")
-            # Go back to connection screen
-            self.app.pop_screen()
+        # Display messages with proper formatting - show ALL messages including own
+        if username == "Server":
+            self._write_line(Text.assemble(("Server:", SERVER_STYLE), " ", message))
+        else:
+            # Text is never parsed as markup, so the message needs no escaping
+            line = self.app.get_user_prefix(username).copy()
+            line.append(message)
+            self._write_line(line)
+
+    def _handle_join(self, data):
+        username = data.get("username", "Unknown")
+        # Handle other users joining - server doesn't send join notifications back to joining user
+        if username and username != self.username:
+            self._write_line(Text(f"A wild {username} has appeared.", style=SERVER_STYLE))
+
+    def _handle_leave(self, data):
+        username = data.get("username", "Unknown") 
+        # Show leave notifications for all users
+        if username and username != self.username:
+            self._write_line(Text(f"{username} has left the chat.", style=SERVER_STYLE))
+
+    async def _handle_colourshift(self, data):
+        # Handle theme color change
+        new_color = data.get("color", "#87CEEB")
+        await self.change_theme_color(new_color)
+        # self._messages_log.write(f"[bold {new_color}]Theme color changed to {new_color}[/bold {new_color}]")
+
+    async def _handle_bgshift(self, data):
+        self._clear_log()
+        bg_color = data.get("color", "#000000")
+        await self.change_background_color(bg_color)
+
+    def _handle_chatclear(self, data):
+        self._clear_log()
+
+    async def _handle_kicked(self, data):
+        kicked_message = data.get("message", "You have been kicked :)")
+        self._clear_log()
+        self._write_line(Text(kicked_message, style=KICKED_STYLE))
+        await asyncio.sleep(5)
+        await self.app.action_quit()
+
+    def _handle_error(self, data):
+        error_message = data.get("message", "Unknown error")
+        self._write_line(f"[bold red]Error: {escape(error_message)}[/bold red]")
+        # If connection failed, go back to connection screen
+        if not self.app.connected:
+            self.app.notify(f"Connection failed: {error_message}", severity="error")
+            self.app.pop_screen()  # Return to connection screen
+
+    def _handle_auth_failed(self, data):
+        error_message = data.get("message", "Authentication failed")
+        self._write_line(f"[bold red]Authentication failed: {escape(error_message)}[/bold red]")
+        self.app.notify(f"Authentication failed: {error_message}", severity="error")
+        # Go back to connection screen
+        self.app.pop_screen()
+
+    def _write_line(self, line):
+        # Queue a line (markup string or Text) for the message log;
+        # lines arriving within one frame share a single write
+        pending = self._pending_lines
+        pending.append(Text.from_markup(line) if isinstance(line, str) else line)
+        if len(pending) >= MAX_PENDING_LINES:
+            self._flush_log()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(LOG_FLUSH_INTERVAL, self._flush_log)
+
+    def _flush_log(self):
+        # Write all pending lines to the message log in one go
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_lines:
+            lines = self._pending_lines
+            self._pending_lines = []
+            self._messages_log.write(Text("\n").join(lines))
+
+    def _clear_log(self):
+        # Clear the message log, dropping any lines that haven't been written yet
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_lines.clear()
+        self._messages_log.clear()
 
     async def send_message(self, user_message: str):
-        # Send message to server
+        # Queue a message for the writer loop to send to the server
         if self.app.websocket and self.app.connected:
             try:
-                message_data = {
-                    "type": "message",
-                    "content": user_message
-                }
-                await self.app.websocket.send(json.dumps(message_data))
-            except websockets.exceptions.ConnectionClosed:
-                messages_log = self.query_one("#messages", RichLog)
-                messages_log.write("[bold red]Cannot send message: Connection closed[/bold red]")
-                self.app.connected = False
-                self.query_one("#header").update("TERMCHAT - Disconnected")
+                # The envelope is fixed, so only the content needs JSON-encoding
+                self._outbox.put_nowait('{"type":"message","content":' + json_dumps(user_message) + '}')
+            except asyncio.QueueFull:
+                self._write_line("[bold yellow]Sending too fast - message not sent.[/bold yellow]")
             except Exception as e:
-                messages_log = self.query_one("#messages", RichLog)
-                messages_log.write(f"[bold red]Error sending message: {e}[/bold red]")
+                # e.g. orjson refuses text that isn't valid UTF-8, such as a lone surrogate
+                self._write_line(f"[bold red]Error sending message: {e}[/bold red]")
         else:
-            messages_log = self.query_one("#messages", RichLog)
-            messages_log.write("[bold yellow]Not connected to server. Cannot send message.[/bold yellow]")
+            self._write_line("[bold yellow]Not connected to server. Cannot send message.[/bold yellow]")
+
+    async def _writer_loop(self):
+        # Send queued messages to the server in order
+        outbox = self._outbox
+        
+        while True:
+            frame = await outbox.get()
+            try:
+                # Looked up per frame since a reconnect replaces the websocket
+                await self.app.websocket.send(frame)
+            except websockets.exceptions.ConnectionClosed:
+                # The listener notices the drop and handles reconnecting
+                self._write_line("[bold red]Cannot send message: Connection closed[/bold red]")
+            except Exception as e:
+                self._write_line(f"[bold red]Error sending message: {e}[/bold red]")
 
     async def change_theme_color(self, new_color: str):
         # Change the theme color of the interface with smooth transition
@@ -746,69 +1007,37 @@ class ChatScreen(Screen):
         # Get current color
         current_color = self.app.theme_color
         
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            if len(hex_color) == 6:
-                return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            return (135, 206, 235)
-        
-        def rgb_to_hex(r, g, b):
-            return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
+        start_rgb = hex_to_rgb(current_color, THEME_RGB)
+        end_rgb = hex_to_rgb(new_color, THEME_RGB)
         
-        start_rgb = hex_to_rgb(current_color)
-        end_rgb = hex_to_rgb(new_color)
+        # Widgets are resolved once in on_mount, so the frame loop can't fail on a lookup
+        header = self._header
+        messages_container = self._messages_container
+        input_container = self._input_container
+        messages = self._messages_log
         
-        try:
-            header = self.query_one("#header")
-            messages_container = self.query_one("#messages_container")
-            input_container = self.query_one("#input_container")
-            messages = self.query_one("#messages")
-            
-            for i in range(steps + 1):
-                t = i / steps
-                
-                # Linear interpolation
-                r = start_rgb[0] + (end_rgb[0] - start_rgb[0]) * t
-                g = start_rgb[1] + (end_rgb[1] - start_rgb[1]) * t
-                b = start_rgb[2] + (end_rgb[2] - start_rgb[2]) * t
-                
-                current_color = rgb_to_hex(r, g, b)
-                scrollbar_color = rgb_to_hex(r * 0.5, g * 0.5, b * 0.5)
-                
-                # Update all at once
+        next_frame = time.monotonic()
+        for current_color, scrollbar_color in color_ramp(start_rgb, end_rgb, steps, 0.5):
+            # Update all at once, coalesced into a single repaint
+            with self.app.batch_update():
                 header.styles.color = current_color
                 messages_container.styles.border = ("solid", current_color)
                 input_container.styles.border = ("solid", current_color)
                 messages.styles.scrollbar_background = current_color
                 messages.styles.scrollbar_color = scrollbar_color
-                
-                # Single refresh call
-                self.refresh()
-                await asyncio.sleep(frame_time)
-            
-            # Final values
-            header.styles.color = new_color
-            messages_container.styles.border = ("solid", new_color)
-            input_container.styles.border = ("solid", new_color)
-            messages.styles.scrollbar_background = new_color
-            messages.styles.scrollbar_color = rgb_to_hex(*(x * 0.5 for x in end_rgb))
-            
-            self.app.theme_color = new_color
-            
-        except Exception:
-            # Instant fallback
-            header = self.query_one("#header")
-            messages_container = self.query_one("#messages_container")
-            input_container = self.query_one("#input_container")
-            messages = self.query_one("#messages")
             
-            header.styles.color = new_color
-            messages_container.styles.border = ("solid", new_color)
-            input_container.styles.border = ("solid", new_color)
-            messages.styles.scrollbar_background = new_color
-            messages.styles.scrollbar_color = rgb_to_hex(*(x * 0.5 for x in hex_to_rgb(new_color)))
-            
-            self.app.theme_color = new_color
+            next_frame += frame_time
+            delay = next_frame - time.monotonic()
+            await asyncio.sleep(delay if delay > 0 else 0)
+        
+        # Final values
+        header.styles.color = new_color
+        messages_container.styles.border = ("solid", new_color)
+        input_container.styles.border = ("solid", new_color)
+        messages.styles.scrollbar_background = new_color
+        messages.styles.scrollbar_color = rgb_to_hex(*(x * 0.5 for x in end_rgb))
+        
+        self.app.theme_color = new_color
     
     async def change_background_color(self, bg_color: str):
         # Change the background color of the entire chat interface with smooth transition
@@ -819,77 +1048,42 @@ class ChatScreen(Screen):
         # Get current background color
         current_bg = getattr(self.app, 'background_color', '#000000')
         
-        def hex_to_rgb(hex_color):
-            hex_color = hex_color.lstrip('#')
-            if len(hex_color) == 6:
-                return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            return (0, 0, 0)
-        
-        def rgb_to_hex(r, g, b):
-            return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
-        
         start_rgb = hex_to_rgb(current_bg)
         end_rgb = hex_to_rgb(bg_color)
         
-        try:
-            header = self.query_one("#header")
-            messages_container = self.query_one("#messages_container")
-            messages = self.query_one("#messages")
-            input_container = self.query_one("#input_container")
-            message_input = self.query_one("#message_input")
-            
-            for i in range(steps + 1):
-                t = i / steps
-                
-                # Linear interpolation
-                r = start_rgb[0] + (end_rgb[0] - start_rgb[0]) * t
-                g = start_rgb[1] + (end_rgb[1] - start_rgb[1]) * t
-                b = start_rgb[2] + (end_rgb[2] - start_rgb[2]) * t
-                
-                current_bg = rgb_to_hex(r, g, b)
-                current_dark = rgb_to_hex(r * 0.7, g * 0.7, b * 0.7)
-                
-                # Update all backgrounds at once
+        # Widgets are resolved once in on_mount, so the frame loop can't fail on a lookup
+        header = self._header
+        messages_container = self._messages_container
+        messages = self._messages_log
+        input_container = self._input_container
+        message_input = self._message_input
+        
+        next_frame = time.monotonic()
+        for current_bg, current_dark in color_ramp(start_rgb, end_rgb, steps, 0.7):
+            # Update all backgrounds at once, coalesced into a single repaint
+            with self.app.batch_update():
                 self.styles.background = current_bg
                 header.styles.background = current_bg
                 messages_container.styles.background = current_bg
                 messages.styles.background = current_bg
                 input_container.styles.background = current_bg
                 message_input.styles.background = current_dark
-                
-                # Single refresh call
-                self.refresh()
-                await asyncio.sleep(frame_time)
-            
-            # Final values
-            dark_final = rgb_to_hex(*(x * 0.7 for x in end_rgb))
-            
-            self.styles.background = bg_color
-            header.styles.background = bg_color
-            messages_container.styles.background = bg_color
-            messages.styles.background = bg_color
-            input_container.styles.background = bg_color
-            message_input.styles.background = dark_final
-            
-            self.app.background_color = bg_color
-            
-        except Exception:
-            # Instant fallback
-            dark_bg = rgb_to_hex(*(x * 0.7 for x in hex_to_rgb(bg_color)))
-            
-            self.styles.background = bg_color
-            header = self.query_one("#header")
-            header.styles.background = bg_color
-            messages_container = self.query_one("#messages_container")
-            messages_container.styles.background = bg_color
-            messages = self.query_one("#messages")
-            messages.styles.background = bg_color
-            input_container = self.query_one("#input_container")
-            input_container.styles.background = bg_color
-            message_input = self.query_one("#message_input")
-            message_input.styles.background = dark_bg
             
-            self.app.background_color = bg_color
+            next_frame += frame_time
+            delay = next_frame - time.monotonic()
+            await asyncio.sleep(delay if delay > 0 else 0)
+        
+        # Final values
+        dark_final = rgb_to_hex(*(x * 0.7 for x in end_rgb))
+        
+        self.styles.background = bg_color
+        header.styles.background = bg_color
+        messages_container.styles.background = bg_color
+        messages.styles.background = bg_color
+        input_container.styles.background = bg_color
+        message_input.styles.background = dark_final
+        
+        self.app.background_color = bg_color
 
 class TermchatApp(App):
     # Main Termchat application using proper screen management
@@ -899,50 +1093,100 @@ class TermchatApp(App):
         "connection": ConnectionScreen,
     }
     
-    def __init__(self):
+    def __init__(self, server_url: str = DEFAULT_SERVER_URL, show_splash: bool = True):
         super().__init__()
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        # Connection opened by the server status check, handed to the first chat join
+        self.spare_websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.user_colors: dict = {}  # Maps usernames to colors
-        self.color_index: int = 0    # For cycling through colors
+        self.color_cycle = itertools.cycle(USER_COLORS)  # Next color for a new user
+        self.user_prefixes: OrderedDict = OrderedDict()  # Maps usernames to their "[name]: " Text, in LRU order
         self.connected: bool = False
         self.theme_color: str = "#87CEEB"  # Current theme color
         
-        # Backend server URL (HTTPS WebSocket on port 443)
-        self.server_url = "wss://termchat-f9cgabe4ajd9djb9.australiaeast-01.azurewebsites.net"
+        self.server_url = server_url
+        self.show_splash = show_splash
 
     def on_mount(self):
-        # Start with the splash screen
-        self.push_screen("splash")
+        # Start with the splash screen, or go straight to the connection screen
+        self.push_screen("splash" if self.show_splash else "connection")
 
     def start_chat(self, username: str, chat_name: str, password: str):
         # Start the chat with the given credentials
         chat_screen = ChatScreen(username, chat_name, password)
         self.push_screen(chat_screen)
 
+    def take_spare_websocket(self):
+        # Hand over the status check's connection once, if it's still open
+        websocket = self.spare_websocket
+        self.spare_websocket = None
+        if websocket is not None and websocket.state is State.OPEN:
+            return websocket
+        return None
+
     def get_user_color(self, username: str) -> str:
         # Get or assign a color for a username
-        if username.lower() == "server":
-            return "bold #87CEEB"
+        color = self.user_colors.get(username)
+        if color is not None:
+            return color
+        
+        if is_reserved_username(username):
+            return SERVER_COLOR
         
-        if username not in self.user_colors:
-            self.user_colors[username] = USER_COLORS[self.color_index % len(USER_COLORS)]
-            self.color_index += 1
+        color = next(self.color_cycle)
+        self.user_colors[username] = color
+        return color
+
+    def get_user_prefix(self, username: str) -> Text:
+        # Get the colored "[username]: " Text for a user, built once per user.
+        # Callers copy it before appending to it.
+        user_prefixes = self.user_prefixes
+        prefix = user_prefixes.get(username)
+        if prefix is not None:
+            user_prefixes.move_to_end(username)
+            return prefix
         
-        return self.user_colors[username]
+        prefix = Text.assemble((f"[{username}]:", Style.parse(self.get_user_color(username))), " ")
+        user_prefixes[username] = prefix
+        # Forget the least recently seen user so long sessions don't grow without bound
+        if len(user_prefixes) > MAX_TRACKED_USERS:
+            evicted, _ = user_prefixes.popitem(last=False)
+            self.user_colors.pop(evicted, None)
+        return prefix
 
     async def action_quit(self):
         # Quit the application
-        if self.websocket:
-            try:
-                await self.websocket.close()
-            except:
-                pass
+        # Mark the session as disconnected first so the listener doesn't try to reconnect
+        self.connected = False
+        # Close the chat connection and the status probe's, if it was never used
+        for websocket in (self.websocket, self.spare_websocket):
+            if websocket:
+                try:
+                    # Don't let a slow close handshake hold up quitting
+                    await asyncio.wait_for(websocket.close(), 0.5)
+                except:
+                    pass
+        self.spare_websocket = None
         self.exit()
 
 
-async def main():
+def parse_args():
+    # Command line options
+    parser = argparse.ArgumentParser(description="Termchat - terminal client for real-time chat")
+    parser.add_argument("--server-url", default=DEFAULT_SERVER_URL,
+                        help="WebSocket URL of the termchat backend")
+    parser.add_argument("--no-splash", action="store_true",
+                        help="skip the splash animation (or set TERMCHAT_NO_SPLASH=1)")
+    args = parser.parse_args()
+    if not args.server_url.startswith(("wss://", "ws://")):
+        parser.error("--server-url must be a wss:// or ws:// URL")
+    return args
+
+async def main(args):
     # Entry point for the application
-    app = TermchatApp()
+    no_splash_env = os.environ.get("TERMCHAT_NO_SPLASH", "").strip().lower() in ("1", "true", "yes")
+    show_splash = not (args.no_splash or no_splash_env)
+    app = TermchatApp(server_url=args.server_url, show_splash=show_splash)
     await app.run_async()
 
 if __name__ == "__main__":
@@ -950,10 +1194,18 @@ if __name__ == "__main__":
         # Ensure asyncio compatibility across platforms
         if sys.platform == "win32":
             asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+        else:
+            # Use uvloop's faster event loop when it's installed
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass
+        args = parse_args()
         # Relaunch in terminal if not already in one
         if not is_in_terminal():
             launch_new_terminal()
-        asyncio.run(main())
+        asyncio.run(main(args))
     except KeyboardInterrupt:
         print("\nExiting...")
     except Exception as e: